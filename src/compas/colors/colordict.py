@@ -55,7 +55,8 @@ class ColorDict(Data):
         self._default = default
 
     def __getitem__(self, key):
-        return self._dict.get(key, self.default)
+        color = self._dict.get(key)
+        return color if color is not None else self.default
 
     def __setitem__(self, key, value):
         self._dict[key] = Color.coerce(value)
@@ -3,21 +3,15 @@ from __future__ import division
 from __future__ import print_function
 
 import os
+from colorsys import hls_to_rgb
 
 from compas.itertools import linspace
 
 from .color import Color
-from .mpl_colormap import _inferno_data
-from .mpl_colormap import _magma_data
-from .mpl_colormap import _plasma_data
-from .mpl_colormap import _viridis_data
 
-mpl = {
-    "magma": _magma_data,
-    "inferno": _inferno_data,
-    "plasma": _plasma_data,
-    "viridis": _viridis_data,
-}
+mpl = {}
+
+_PALETTE_CACHE = {}
 
 
 class ColorMap(object):
@@ -58,7 +52,7 @@ class ColorMap(object):
     """
 
     def __init__(self, colors):
-        self._colors = []
+        self._rgb = []
         self.colors = colors
 
     # --------------------------------------------------------------------------
@@ -67,21 +61,63 @@ class ColorMap(object):
 
     @property
     def colors(self):
-        return self._colors
+        return [Color(r, g, b) for r, g, b in self._rgb]
 
     @colors.setter
     def colors(self, colors):
         if len(colors) != 256:
             raise ValueError("The color map should have 256 colors.")
-        self._colors = [Color(r, g, b) for r, g, b in colors]
+        self._rgb = [color.rgb if isinstance(color, Color) else (color[0], color[1], color[2]) for color in colors]
+        self._n_minus_1 = len(self._rgb) - 1
 
     # --------------------------------------------------------------------------
     # customization
     # --------------------------------------------------------------------------
 
-    def __call__(self, value, minval=0.0, maxval=1.0):
+    def __call__(self, value, minval=0.0, maxval=1.0, clamp=False):
         """Returns the color in the map corresponding to the given value in the range ``[minval, maxval]``.
 
+        Parameters
+        ----------
+        value : float
+            The data value for which a color should be computed.
+        minval : float, optional
+            The minimum value of the data range.
+        maxval : float, optional
+            The maximum value of the data range.
+        clamp : bool, optional
+            If True, clamp out-of-range values to the nearest endpoint color
+            instead of raising an exception.
+
+        Returns
+        -------
+        :class:`compas.colors.Color`
+
+        Raises
+        ------
+        KeyError
+            If the value is not in the range ``[minval, maxval]`` and ``clamp`` is False.
+
+        """
+        key = (value - minval) / (maxval - minval)
+        if key > 1.0 or key < 0.0:
+            if not clamp:
+                raise KeyError("The normalized value must be in the range 0 - 1.")
+            key = min(max(key, 0.0), 1.0)
+        index = int(key * self._n_minus_1)
+        return Color(*self._rgb[index])
+
+    # --------------------------------------------------------------------------
+    # methods
+    # --------------------------------------------------------------------------
+
+    def interpolate(self, value, minval=0.0, maxval=1.0):
+        """Returns a color interpolated between the two nearest colors of the map.
+
+        In contrast to ``__call__``, which snaps to the nearest entry of the map,
+        this method computes a linear blend between the two entries surrounding
+        the given value, resulting in smoother gradients when sampling.
+
         Parameters
         ----------
         value : float
@@ -104,8 +140,39 @@ class ColorMap(object):
         key = (value - minval) / (maxval - minval)
         if key > 1.0 or key < 0.0:
             raise KeyError("The normalized value must be in the range 0 - 1.")
-        index = int(key * (len(self.colors) - 1))
-        return self.colors[index]
+        t = key * self._n_minus_1
+        i = int(t)
+        j = min(i + 1, self._n_minus_1)
+        w = t - i
+        c1 = self._rgb[i]
+        c2 = self._rgb[j]
+        return Color(
+            c1[0] * (1 - w) + c2[0] * w,
+            c1[1] * (1 - w) + c2[1] * w,
+            c1[2] * (1 - w) + c2[2] * w,
+        )
+
+    def materialize(self, n):
+        """Returns a precomputed lookup table of ``n`` colors evenly sampled from the map.
+
+        This is useful when shading values that fall into a fixed number of bins:
+        compute the integer bin per value once, and index the returned table
+        directly instead of going through ``__call__`` in a tight loop.
+
+        Parameters
+        ----------
+        n : int
+            The number of colors in the table.
+
+        Returns
+        -------
+        list[:class:`compas.colors.Color`]
+
+        """
+        if n < 2:
+            raise ValueError("The table should have at least 2 colors.")
+        step = 1.0 / (n - 1)
+        return [Color(*self._rgb[int(i * step * self._n_minus_1)]) for i in range(n)]
 
     # --------------------------------------------------------------------------
     # constructors
@@ -137,19 +204,12 @@ class ColorMap(object):
         See `compas/colors/cmcrameri/LICENSE` for more info.
 
         """
-        here = os.path.dirname(__file__)
-        path = os.path.join(here, "cmcrameri", "{}.txt".format(name))
-        colors = []
-        with open(path, "r") as f:
-            for line in f:
-                if line:
-                    parts = line.split()
-                    if len(parts) == 3:
-                        r = float(parts[0])
-                        g = float(parts[1])
-                        b = float(parts[2])
-                        colors.append((r, g, b))
-        cmap = cls(colors)
+        if name not in _PALETTE_CACHE:
+            here = os.path.dirname(__file__)
+            path = os.path.join(here, "cmcrameri", "{}.txt".format(name))
+            with open(path, "r") as f:
+                _PALETTE_CACHE[name] = [tuple(map(float, parts)) for parts in (line.split() for line in f) if len(parts) == 3]
+        cmap = cls(_PALETTE_CACHE[name])
         return cmap
 
     @classmethod
@@ -178,8 +238,17 @@ class ColorMap(object):
         See `compas/colors/mpl_colormap.py` for more info and license information.
 
         """
-        colors = [Color(r, g, b) for r, g, b in mpl[name]]
-        return cls(colors)
+        if not mpl:
+            from .mpl_colormap import _inferno_data
+            from .mpl_colormap import _magma_data
+            from .mpl_colormap import _plasma_data
+            from .mpl_colormap import _viridis_data
+
+            mpl["magma"] = _magma_data
+            mpl["inferno"] = _inferno_data
+            mpl["plasma"] = _plasma_data
+            mpl["viridis"] = _viridis_data
+        return cls(mpl[name])
 
     @classmethod
     def from_color(cls, color, rangetype="full"):
@@ -204,21 +273,16 @@ class ColorMap(object):
         h, _, s = color.hls
 
         if rangetype == "full":
-            step = 1.0 / (n - 1)
-            colors = [Color.from_hls(h, 0.0 + i * step, s) for i in range(n)]
-            return cls(colors)
-
-        if rangetype == "light":
-            step = 0.5 / (n - 1)
-            colors = [Color.from_hls(h, 0.5 + i * step, s) for i in range(n)]
-            return cls(colors)
-
-        if rangetype == "dark":
-            step = 0.5 / (n - 1)
-            colors = [Color.from_hls(h, 0.0 + i * step, s) for i in range(n)]
-            return cls(colors)
+            start, step = 0.0, 1.0 / (n - 1)
+        elif rangetype == "light":
+            start, step = 0.5, 0.5 / (n - 1)
+        elif rangetype == "dark":
+            start, step = 0.0, 0.5 / (n - 1)
+        else:
+            raise ValueError("`rangetype` should be one of 'full', 'light', 'dark'.")
 
-        raise ValueError("`rangetype` should be one of 'full', 'light', 'dark'.")
+        colors = [hls_to_rgb(h, start + i * step, s) for i in range(n)]
+        return cls(colors)
 
     @classmethod
     def from_two_colors(cls, c1, c2, diverging=False):
@@ -241,22 +305,17 @@ class ColorMap(object):
         """
         colors = []
         if diverging:
+            r1, g1, b1 = c1[0], c1[1], c1[2]
             for i in linspace(0, 1.0, 128):
-                r = c1[0] * (1 - i) + 1.0 * i
-                g = c1[1] * (1 - i) + 1.0 * i
-                b = c1[2] * (1 - i) + 1.0 * i
-                colors.append(Color(r, g, b))
+                colors.append((r1 + (1.0 - r1) * i, g1 + (1.0 - g1) * i, b1 + (1.0 - b1) * i))
+            r2, g2, b2 = c2[0], c2[1], c2[2]
             for i in linspace(0, 1.0, 128):
-                r = 1.0 * (1 - i) + c2[0] * i
-                g = 1.0 * (1 - i) + c2[1] * i
-                b = 1.0 * (1 - i) + c2[2] * i
-                colors.append(Color(r, g, b))
+                colors.append((1.0 + (r2 - 1.0) * i, 1.0 + (g2 - 1.0) * i, 1.0 + (b2 - 1.0) * i))
         else:
+            r1, g1, b1 = c1[0], c1[1], c1[2]
+            dr, dg, db = c2[0] - r1, c2[1] - g1, c2[2] - b1
             for i in linspace(0, 1, 256):
-                r = c1[0] * (1 - i) + c2[0] * i
-                g = c1[1] * (1 - i) + c2[1] * i
-                b = c1[2] * (1 - i) + c2[2] * i
-                colors.append(Color(r, g, b))
+                colors.append((r1 + dr * i, g1 + dg * i, b1 + db * i))
         return cls(colors)
 
     @classmethod
@@ -22,6 +22,20 @@ def from_boolean_union(*args, **kwargs):
     raise PluginNotInstalledError
 
 
+@pluggable(category="factories")
+def from_boolean_union_many(breps):
+    # Default implementation folds the breps pairwise.
+    # Backends can plug in a native N-ary boolean that
+    # shares the intersection computation across all operands.
+    # A union of disjoint solids can yield multiple breps;
+    # the accumulated result is carried forward as is,
+    # since the backends accept lists on either side of a boolean.
+    result = breps[0]
+    for brep in breps[1:]:
+        result = from_boolean_union(result, brep)
+    return result
+
+
 @pluggable(category="factories")
 def from_brepfaces(*args, **kwargs):
     raise PluginNotInstalledError
@@ -3,6 +3,7 @@ from compas.geometry import Geometry
 from . import from_boolean_difference
 from . import from_boolean_intersection
 from . import from_boolean_union
+from . import from_boolean_union_many
 from . import from_box
 from . import from_brepfaces
 from . import from_cone
@@ -151,18 +152,15 @@ class Brep(Geometry):
         super(Brep, self).__init__(*args, **kwargs)
 
     def __str__(self):
-        lines = [
-            "Brep",
-            "-----",
-            "Vertices: {}".format(len(self.vertices)),
-            "Edges: {}".format(len(self.edges)),
-            "Loops: {}".format(len(self.loops)),
-            "Faces: {}".format(len(self.faces)),
-            "Frame: {}".format(self.frame),
-            "Area: {}".format(self.area),
-            "Volume: {}".format(self.volume),
-        ]
-        return "\n".join(lines)
+        return "Brep\n-----\nVertices: {}\nEdges: {}\nLoops: {}\nFaces: {}\nFrame: {}\nArea: {}\nVolume: {}".format(
+            len(self.vertices),
+            len(self.edges),
+            len(self.loops),
+            len(self.faces),
+            self.frame,
+            self.area,
+            self.volume,
+        )
 
     # ==============================================================================
     # Properties
@@ -186,7 +184,7 @@ class Brep(Geometry):
 
     @property
     def is_shell(self):
-        raise NotImplementedError
+        return self.type == BrepType.SHELL
 
     @property
     def is_solid(self):
@@ -194,11 +192,11 @@ class Brep(Geometry):
 
     @property
     def is_compound(self):
-        raise NotImplementedError
+        return self.type == BrepType.COMPOUND
 
     @property
     def is_compoundsolid(self):
-        raise NotImplementedError
+        return self.type == BrepType.COMPSOLID
 
     @property
     def is_orientable(self):
@@ -653,6 +651,27 @@ class Brep(Geometry):
         """
         return from_boolean_union(brep_a, brep_b)
 
+    @classmethod
+    def from_boolean_union_many(cls, breps):
+        """Construct a Brep from the boolean union of multiple other Breps.
+
+        Parameters
+        ----------
+        breps : list[:class:`compas.geometry.Brep`]
+            The Breps to unify.
+
+        Returns
+        -------
+        :class:`compas.geometry.Brep`
+
+        Notes
+        -----
+        If the backend provides a native N-ary boolean operation, all Breps
+        are combined in a single pass. Otherwise they are unified pairwise.
+
+        """
+        return from_boolean_union_many(breps)
+
     def __sub__(self, other):
         """Compute the boolean difference using the "-" operator of this shape and another.
 
@@ -2,9 +2,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from bisect import bisect_left
+from math import asinh
+from math import sqrt
+
 from compas.geometry import Frame
 from compas.geometry import Point
 from compas.geometry import Vector
+from compas.geometry import transform_points
 
 from .conic import Conic
 from .line import Line
@@ -105,6 +110,8 @@ class Parabola(Conic):
     def __init__(self, focal, frame=None, name=None):
         super(Parabola, self).__init__(frame=frame, name=name)
         self._focal = None
+        self._a = None
+        self._arclength_lut = None
         self.focal = focal
 
     def __repr__(self):
@@ -133,10 +140,14 @@ class Parabola(Conic):
     @focal.setter
     def focal(self, focal):
         self._focal = focal
+        self._a = None
+        self._arclength_lut = None
 
     @property
     def a(self):
-        return 1 / (4 * self.focal)
+        if self._a is None:
+            self._a = 1 / (4 * self.focal)
+        return self._a
 
     @a.setter
     def a(self, a):
@@ -199,10 +210,125 @@ class Parabola(Conic):
         y = self.a * x**2
         z = 0
         point = Point(x, y, z)
-        if world:
+        if world and self._frame is not None:
             point.transform(self.transformation)
         return point
 
+    def points_at(self, params, world=True):
+        """
+        Points at multiple parameters.
+
+        Parameters
+        ----------
+        params : sequence[float]
+            The curve parameters.
+        world : bool, optional
+            If ``True``, the points are returned in world coordinates.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Point`]
+
+        """
+        a = self.a
+        points = [[t, a * t * t, 0.0] for t in params]
+        if world and self._frame is not None:
+            points = transform_points(points, self.transformation)
+        return [Point(*xyz) for xyz in points]
+
+    def arc_length_at(self, t):
+        """
+        Arc length along the parabola between the vertex and the parameter.
+
+        Parameters
+        ----------
+        t : float
+            The curve parameter.
+
+        Returns
+        -------
+        float
+            The signed arc length measured from the vertex.
+
+        """
+        a = self.a
+        u = 2 * a * t
+        return 0.5 * t * sqrt(1 + u * u) + asinh(u) / (4 * a)
+
+    def point_at_arc_length(self, s, domain=(0.0, 1.0), world=True):
+        """
+        Point at a given arc length measured from the start of a parameter interval.
+
+        A lookup table of arc lengths over the interval is computed once and cached,
+        so repeated calls only perform a binary search and a linear interpolation
+        of the parameter. The table is invalidated when the focal length changes.
+
+        Parameters
+        ----------
+        s : float
+            The arc length along the curve, measured from the start of the interval.
+        domain : tuple[float, float], optional
+            The parameter interval in which the point is located.
+        world : bool, optional
+            If ``True``, the point is returned in world coordinates.
+
+        Returns
+        -------
+        :class:`compas.geometry.Point`
+
+        Raises
+        ------
+        ValueError
+            If the arc length is negative or exceeds the length of the interval.
+
+        """
+        lut = self._arclength_lut
+        if lut is None or lut[0] != domain:
+            n = 256
+            start, end = domain
+            step = (end - start) / (n - 1)
+            params = [start + i * step for i in range(n)]
+            offset = self.arc_length_at(start)
+            lengths = [self.arc_length_at(t) - offset for t in params]
+            lut = (domain, params, lengths)
+            self._arclength_lut = lut
+        _, params, lengths = lut
+        if s < 0 or s > lengths[-1]:
+            raise ValueError("The arc length must be in the range 0 - {}.".format(lengths[-1]))
+        i = bisect_left(lengths, s)
+        if i == 0:
+            return self.point_at(params[0], world=world)
+        ds = lengths[i] - lengths[i - 1]
+        w = (s - lengths[i - 1]) / ds if ds else 0.0
+        t = params[i - 1] + w * (params[i] - params[i - 1])
+        return self.point_at(t, world=world)
+
+    def frame_at(self, t, world=True):
+        """
+        Frame at the parameter.
+
+        Parameters
+        ----------
+        t : float
+            The curve parameter.
+        world : bool, optional
+            If ``True``, the frame is returned in world coordinates.
+
+        Returns
+        -------
+        :class:`compas.geometry.Frame`
+
+        """
+        a = self.a
+        dy = 2 * a * t
+        point = Point(t, a * t * t, 0.0)
+        xaxis = Vector(1.0, dy, 0.0)
+        yaxis = Vector(-dy, 1.0, 0.0)
+        frame = Frame(point, xaxis, yaxis)
+        if world and self._frame is not None:
+            frame.transform(self.transformation)
+        return frame
+
     def tangent_at(self, t, world=True):
         """
         Tangent vector at the parameter.
@@ -219,13 +345,10 @@ class Parabola(Conic):
         :class:`compas_future.geometry.Vector`
 
         """
-        x0 = t
-        y0 = self.a * t**2
-        x = 2 * t
-        y = 2 * self.a * x0 * x - y0
-        tangent = Vector(x - x0, y - y0, 0)
-        tangent.unitize()
-        if world:
+        dy = 2 * self.a * t
+        scale = 1 / sqrt(1 + dy * dy)
+        tangent = Vector(scale, dy * scale, 0)
+        if world and self._frame is not None:
             tangent.transform(self.transformation)
         return tangent
 
@@ -245,12 +368,9 @@ class Parabola(Conic):
         :class:`compas_future.geometry.Vector`
 
         """
-        x0 = t
-        y0 = self.a * t**2
-        x = 2 * t
-        y = 2 * self.a * x0 * x - y0
-        normal = Vector(y0 - y, x - x0, 0)
-        normal.unitize()
-        if world:
+        dy = 2 * self.a * t
+        scale = 1 / sqrt(1 + dy * dy)
+        normal = Vector(-dy * scale, scale, 0)
+        if world and self._frame is not None:
             normal.transform(self.transformation)
         return normal
@@ -67,6 +67,11 @@ class Transformation(Data):
         Flattens the 4x4 transformation matrix into a list of 16 numbers.
     determinant : float, read-only
         The determinant of the matrix of the transformation.
+    is_identity : bool, read-only
+        True if the transformation is the identity transformation.
+    is_rigid : bool, read-only
+        True if the transformation only rotates, reflects and translates,
+        i.e. it preserves distances.
 
     Examples
     --------
@@ -199,6 +204,22 @@ class Transformation(Data):
     def determinant(self):
         return matrix_determinant(self.matrix)
 
+    @property
+    def is_identity(self):
+        return self.matrix == identity_matrix(4)
+
+    @property
+    def is_rigid(self):
+        matrix = self.matrix
+        if matrix[3][0] != 0 or matrix[3][1] != 0 or matrix[3][2] != 0 or matrix[3][3] != 1:
+            return False
+        for i in range(3):
+            for j in range(i, 3):
+                dot = matrix[0][i] * matrix[0][j] + matrix[1][i] * matrix[1][j] + matrix[2][i] * matrix[2][j]
+                if not TOL.is_close(dot, 1.0 if i == j else 0.0):
+                    return False
+        return True
+
     # ==========================================================================
     # Constructors
     # ==========================================================================
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from math import sqrt
+
 from compas.geometry import Geometry
 from compas.geometry import angle_vectors
 from compas.geometry import angle_vectors_signed
@@ -38,6 +40,8 @@ class Vector(Geometry):
         The Z coordinate of the point.
     length : float, read-only
         The length of this vector.
+    length_squared : float, read-only
+        The squared length of this vector.
 
     Examples
     --------
@@ -92,6 +96,24 @@ class Vector(Geometry):
         self.y = y
         self.z = z
 
+    @classmethod
+    def _make(cls, x, y, z):
+        # Fast construction path for arithmetic results.
+        # The components are known to be floats already,
+        # so the base class init and the coercing setters can be skipped.
+        # The attribute layout has to mirror that of __init__.
+        vector = object.__new__(cls)
+        vector._guid = None
+        vector._name = None
+        vector._aabb = None
+        vector._obb = None
+        vector._direction = None
+        vector._magnitude = None
+        vector._x = x
+        vector._y = y
+        vector._z = z
+        return vector
+
     def __repr__(self):
         return "{0}(x={1}, y={2}, z={3})".format(
             type(self).__name__,
@@ -114,76 +136,65 @@ class Vector(Geometry):
     def __getitem__(self, key):
         if isinstance(key, slice):
             return [self[i] for i in range(*key.indices(len(self)))]
-        i = key % 3
-        if i == 0:
-            return self.x
-        if i == 1:
-            return self.y
-        if i == 2:
-            return self.z
-        raise KeyError
+        return (self._x, self._y, self._z)[key % 3]
 
     def __setitem__(self, key, value):
-        i = key % 3
-        if i == 0:
-            self.x = value
-            return
-        if i == 1:
-            self.y = value
-            return
-        if i == 2:
-            self.z = value
-            return
-        raise KeyError
+        setattr(self, ("x", "y", "z")[key % 3], value)
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter((self._x, self._y, self._z))
 
     def __eq__(self, other):
-        return self.x == other[0] and self.y == other[1] and self.z == other[2]
+        if isinstance(other, Vector):
+            return (self._x, self._y, self._z) == (other._x, other._y, other._z)
+        return self._x == other[0] and self._y == other[1] and self._z == other[2]
 
     def __add__(self, other):
-        return Vector(self.x + other[0], self.y + other[1], self.z + other[2])
+        return Vector._make(self._x + other[0], self._y + other[1], self._z + other[2])
 
     def __sub__(self, other):
-        return Vector(self.x - other[0], self.y - other[1], self.z - other[2])
+        return Vector._make(self._x - other[0], self._y - other[1], self._z - other[2])
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Vector(self.x * other, self.y * other, self.z * other)
+            return Vector._make(self._x * other, self._y * other, self._z * other)
 
         try:
             other = Vector(*other)
-            return Vector(self.x * other.x, self.y * other.y, self.z * other.z)
+            return Vector._make(self._x * other._x, self._y * other._y, self._z * other._z)
         except TypeError:
             raise TypeError("Cannot cast {} {} to Vector".format(other, type(other)))
 
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
-            return Vector(self.x / other, self.y / other, self.z / other)
+            return Vector._make(self._x / other, self._y / other, self._z / other)
 
         try:
             other = Vector(*other)
-            return Vector(self.x / other.x, self.y / other.y, self.z / other.z)
+            return Vector._make(self._x / other._x, self._y / other._y, self._z / other._z)
         except TypeError:
             raise TypeError("Cannot cast {} {} to Vector".format(other, type(other)))
 
     def __pow__(self, n):
-        return Vector(self.x**n, self.y**n, self.z**n)
+        return Vector._make(self._x**n, self._y**n, self._z**n)
 
     def __neg__(self):
-        return self.scaled(-1.0)
+        return Vector._make(-self._x, -self._y, -self._z)
 
     def __iadd__(self, other):
-        self.x += other[0]
-        self.y += other[1]
-        self.z += other[2]
+        self._x += other[0]
+        self._y += other[1]
+        self._z += other[2]
+        self._direction = None
+        self._magnitude = None
         return self
 
     def __isub__(self, other):
-        self.x -= other[0]
-        self.y -= other[1]
-        self.z -= other[2]
+        self._x -= other[0]
+        self._y -= other[1]
+        self._z -= other[2]
+        self._direction = None
+        self._magnitude = None
         return self
 
     def __imul__(self, n):
@@ -234,7 +245,7 @@ class Vector(Geometry):
 
     @x.setter
     def x(self, x):
-        self._x = float(x)
+        self._x = x if type(x) is float else float(x)
         self._direction = None
         self._magnitude = None
 
@@ -244,7 +255,7 @@ class Vector(Geometry):
 
     @y.setter
     def y(self, y):
-        self._y = float(y)
+        self._y = y if type(y) is float else float(y)
         self._direction = None
         self._magnitude = None
 
@@ -254,20 +265,24 @@ class Vector(Geometry):
 
     @z.setter
     def z(self, z):
-        self._z = float(z)
+        self._z = z if type(z) is float else float(z)
         self._direction = None
         self._magnitude = None
 
     @property
     def magnitude(self):
         if self._magnitude is None:
-            self._magnitude = length_vector(self)
+            self._magnitude = sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
         return self._magnitude
 
     @property
     def length(self):
         return self.magnitude
 
+    @property
+    def length_squared(self):
+        return self._x * self._x + self._y * self._y + self._z * self._z
+
     @property
     def direction(self):
         if not self._direction:
@@ -387,9 +402,11 @@ class Vector(Geometry):
         """
         data = transform_vectors(collection, X)
         for vector, xyz in zip(collection, data):
-            vector.x = xyz[0]
-            vector.y = xyz[1]
-            vector.z = xyz[2]
+            vector._x = xyz[0]
+            vector._y = xyz[1]
+            vector._z = xyz[2]
+            vector._direction = None
+            vector._magnitude = None
 
     @staticmethod
     def transformed_collection(collection, X):
@@ -419,9 +436,8 @@ class Vector(Geometry):
         False
 
         """
-        vectors = [vector.copy() for vector in collection]
-        Vector.transform_collection(vectors, X)
-        return vectors
+        data = transform_vectors(collection, X)
+        return [Vector._make(xyz[0], xyz[1], xyz[2]) for xyz in data]
 
     @staticmethod
     def length_vectors(vectors):
@@ -465,7 +481,12 @@ class Vector(Geometry):
         Vector(3.000, 0.000, 0.000)
 
         """
-        return Vector(*[sum(axis) for axis in zip(*vectors)])
+        sx = sy = sz = 0.0
+        for vector in vectors:
+            sx += vector[0]
+            sy += vector[1]
+            sz += vector[2]
+        return Vector._make(sx, sy, sz)
 
     @staticmethod
     def dot_vectors(left, right):
@@ -489,7 +510,7 @@ class Vector(Geometry):
         [1.0, 4.0]
 
         """
-        return [Vector.dot(u, v) for u, v in zip(left, right)]
+        return [dot_vectors(u, v) for u, v in zip(left, right)]
 
     @staticmethod
     def cross_vectors(left, right):
@@ -513,7 +534,6 @@ class Vector(Geometry):
         [Vector(0.000, 0.000, 1.000), Vector(0.000, -4.000, 0.000)]
 
         """
-        # cross_vectors(u,v) from src\compas\geometry\_core\_algebra.py
         return [Vector(*cross_vectors(u, v)) for u, v in zip(left, right)]
 
     @staticmethod
@@ -587,6 +607,8 @@ class Vector(Geometry):
 
         """
         cls = type(self)
+        if cls is Vector:
+            return Vector._make(self._x, self._y, self._z)
         return cls(self.x, self.y, self.z)
 
     # ==========================================================================
@@ -608,10 +630,12 @@ class Vector(Geometry):
         1.0
 
         """
-        length = self.length
-        self.x = self.x / length
-        self.y = self.y / length
-        self.z = self.z / length
+        scale = 1.0 / self.length
+        self._x *= scale
+        self._y *= scale
+        self._z *= scale
+        self._direction = None
+        self._magnitude = None
 
     def unitized(self):
         """Returns a unitized copy of this vector.
@@ -678,7 +702,7 @@ class Vector(Geometry):
         0.0
 
         """
-        return self.scaled(-1.0)
+        return Vector._make(-self._x, -self._y, -self._z)
 
     def scale(self, n):
         """Scale this vector by a factor n.
@@ -267,10 +267,10 @@ def pluggable(
     """
 
     def pluggable_decorator(func):
+        extension_point_url = _get_extension_point_url_from_method(domain, category, func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            extension_point_url = _get_extension_point_url_from_method(domain, category, func)
-
             # Select first matching plugin
             if selector == "first_match":
                 plugin_impl = _select_plugin(extension_point_url)
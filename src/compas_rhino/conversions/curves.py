@@ -19,6 +19,7 @@ from .geometry import plane_to_compas_frame
 from .geometry import plane_to_rhino
 from .geometry import point_to_compas
 from .geometry import point_to_rhino
+from .geometry import vector_to_rhino
 
 # =============================================================================
 # To Rhino
@@ -127,7 +128,9 @@ def circle_to_rhino(circle):
     :rhino:`Rhino.Geometry.Circle`
 
     """
-    return Rhino.Geometry.Circle(plane_to_rhino(circle.plane), circle.radius)
+    frame = circle.frame
+    plane = Rhino.Geometry.Plane(point_to_rhino(frame.point), vector_to_rhino(frame.zaxis))
+    return Rhino.Geometry.Circle(plane, circle.radius)
 
 
 def circle_to_rhino_curve(circle):
@@ -4,10 +4,16 @@ from __future__ import print_function
 
 import Rhino  # type: ignore
 
+_transform_cache = {}
+
 
 def transformation_to_rhino(transformation):
     """Creates a Rhino transformation from a COMPAS transformation.
 
+    The Rhino transformation is cached by matrix value,
+    so repeatedly converting the same transformation
+    (for example when redrawing a scene) only marshals the matrix once.
+
     Parameters
     ----------
     transformation : :class:`compas.geometry.Transformation`
@@ -18,10 +24,16 @@ def transformation_to_rhino(transformation):
     :rhino:`Rhino.Geometry.Transform`
 
     """
-    transform = Rhino.Geometry.Transform(1.0)
-    for i in range(0, 4):
-        for j in range(0, 4):
-            transform[i, j] = transformation[i, j]
+    key = tuple(transformation.list)
+    transform = _transform_cache.get(key)
+    if transform is None:
+        if len(_transform_cache) >= 512:
+            _transform_cache.clear()
+        transform = Rhino.Geometry.Transform(1.0)
+        for i in range(0, 4):
+            for j in range(0, 4):
+                transform[i, j] = transformation[i, j]
+        _transform_cache[key] = transform
     return transform
 
 
@@ -30,6 +30,10 @@ class RhinoBrepTrim(BrepTrim):
         self._curve = None
         self._is_reversed = None
         self._iso_type = None
+        self._iso_str = None
+        self._vertex_index = None
+        self._edge_index = None
+        self._curve_data = None
         if rhino_trim:
             self.native_trim = rhino_trim
 
@@ -39,12 +43,14 @@ class RhinoBrepTrim(BrepTrim):
 
     @property
     def __data__(self):
+        if self._curve_data is None:
+            self._curve_data = RhinoNurbsCurve.from_rhino(self._trim.TrimCurve.ToNurbsCurve()).__data__
         return {
-            "vertex": self._trim.StartVertex.VertexIndex,
-            "edge": self._trim.Edge.EdgeIndex if self._trim.Edge else -1,  # singular trims have no associated edge
-            "curve": RhinoNurbsCurve.from_rhino(self._trim.TrimCurve.ToNurbsCurve()).__data__,
-            "iso": str(self._trim.IsoStatus),
-            "is_reversed": "true" if self._trim.IsReversed() else "false",
+            "vertex": self._vertex_index,
+            "edge": self._edge_index,
+            "curve": self._curve_data,
+            "iso": self._iso_str,
+            "is_reversed": ("false", "true")[bool(self._is_reversed)],
         }
 
     @classmethod
@@ -97,3 +103,7 @@ class RhinoBrepTrim(BrepTrim):
         self._curve = RhinoNurbsCurve.from_rhino(rhino_trim.TrimCurve.ToNurbsCurve())
         self._is_reversed = rhino_trim.IsReversed()
         self._iso_type = int(rhino_trim.IsoStatus)
+        self._iso_str = str(rhino_trim.IsoStatus)
+        self._vertex_index = rhino_trim.StartVertex.VertexIndex
+        self._edge_index = rhino_trim.Edge.EdgeIndex if rhino_trim.Edge else -1  # singular trims have no associated edge
+        self._curve_data = None
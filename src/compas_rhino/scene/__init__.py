@@ -64,6 +64,13 @@ def clear_rhino(guids=None):
     compas_rhino.clear(guids=guids)
 
 
+@plugin(category="drawing-utils", pluggable_name="before_draw", requires=["Rhino"])
+def before_draw_rhino():
+    import rhinoscriptsyntax as rs  # type: ignore
+
+    rs.EnableRedraw(False)
+
+
 @plugin(category="drawing-utils", pluggable_name="after_draw", requires=["Rhino"])
 def after_draw_rhino(drawn_objects):
     compas_rhino.redraw()
@@ -25,7 +25,9 @@ class RhinoBoxObject(RhinoSceneObject, GeometryObject):
         """
         attr = self.compile_attributes()
         geometry = box_to_rhino(self.geometry)
-        geometry.Transform(transformation_to_rhino(self.worldtransformation))
+        transformation = self.worldtransformation
+        if not transformation.is_identity:
+            geometry.Transform(transformation_to_rhino(transformation))
 
-        self._guids = [sc.doc.Objects.AddBox(geometry, attr)]
+        self._guids = (sc.doc.Objects.AddBox(geometry, attr),)
         return self.guids
@@ -25,7 +25,9 @@ class RhinoCurveObject(RhinoSceneObject, GeometryObject):
         """
         attr = self.compile_attributes()
         geometry = curve_to_rhino(self.geometry)
-        geometry.Transform(transformation_to_rhino(self.worldtransformation))
+        transformation = self.worldtransformation
+        if not transformation.is_identity:
+            geometry.Transform(transformation_to_rhino(transformation))
 
-        self._guids = [sc.doc.Objects.AddCurve(geometry, attr)]
+        self._guids = (sc.doc.Objects.AddCurve(geometry, attr),)
         return self.guids
@@ -25,8 +25,19 @@ class RhinoEllipseObject(RhinoSceneObject, GeometryObject):
         """
         attr = self.compile_attributes()
         ellipse = ellipse_to_rhino(self.geometry)
-        ellipse = ellipse.ToNurbsCurve()
-        ellipse.Transform(transformation_to_rhino(self.worldtransformation))
-
-        self._guids = [sc.doc.Objects.AddCurve(ellipse, attr)]
+        transformation = self.worldtransformation
+
+        if transformation.is_rigid:
+            # a rigid transformation leaves the radii untouched,
+            # so moving the plane is enough and the control net
+            # of the NURBS curve never has to be transformed.
+            plane = ellipse.Plane
+            plane.Transform(transformation_to_rhino(transformation))
+            ellipse.Plane = plane
+            curve = ellipse.ToNurbsCurve()
+        else:
+            curve = ellipse.ToNurbsCurve()
+            curve.Transform(transformation_to_rhino(transformation))
+
+        self._guids = [sc.doc.Objects.AddCurve(curve, attr)]
         return self.guids
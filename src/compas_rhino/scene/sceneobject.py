@@ -36,9 +36,20 @@ class RhinoSceneObject(SceneObject):
 
     def __init__(self, layer=None, group=None, **kwargs):
         super(RhinoSceneObject, self).__init__(**kwargs)
+        self._layer = None
+        self._layer_index = None
         self.layer = layer
         self.group = group
 
+    @property
+    def layer(self):
+        return self._layer
+
+    @layer.setter
+    def layer(self, layer):
+        self._layer = layer
+        self._layer_index = None
+
     def get_group(self, name):
         """Find the group with the given name, or create a new one.
 
@@ -118,8 +129,10 @@ class RhinoSceneObject(SceneObject):
             attributes.ObjectColor = System.Drawing.Color.FromArgb(*color.rgb255)
             attributes.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
 
-        if self.layer:
-            attributes.LayerIndex = ensure_layer(self.layer)
+        if self._layer:
+            if self._layer_index is None:
+                self._layer_index = ensure_layer(self._layer)
+            attributes.LayerIndex = self._layer_index
 
         if arrow:
             if arrow == "end":
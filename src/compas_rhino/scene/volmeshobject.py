@@ -192,18 +192,22 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
         """
         guids = []
 
-        vertices = list(self.volmesh.vertices()) if self.show_vertices is True else self.show_vertices or []
+        vertices = self.volmesh.vertices() if self.show_vertices is True else self.show_vertices or []
 
-        if vertices:
-            for vertex in vertices:
-                name = "{}.vertex.{}".format(self.volmesh.name, vertex)
-                color = self.vertexcolor[vertex]
-                attr = self.compile_attributes(name=name, color=color)
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        vertexcolor = self.vertexcolor
+        add_point = sc.doc.Objects.AddPoint
 
-                point = self.vertex_xyz[vertex]
+        for vertex in vertices:
+            name = "{}.vertex.{}".format(meshname, vertex)
+            color = vertexcolor[vertex]
+            attr = self.compile_attributes(name=name, color=color)
 
-                guid = sc.doc.Objects.AddPoint(point_to_rhino(point), attr)
-                guids.append(guid)
+            point = vertex_xyz[vertex]
+
+            guid = add_point(point_to_rhino(point), attr)
+            guids.append(guid)
 
         if guids:
             if self.vertexgroup:
@@ -225,18 +229,22 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
         """
         guids = []
 
-        edges = list(self.volmesh.edges()) if self.show_edges is True else self.show_edges or []
+        edges = self.volmesh.edges() if self.show_edges is True else self.show_edges or []
+
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        edgecolor = self.edgecolor
+        add_line = sc.doc.Objects.AddLine
 
-        if edges:
-            for edge in edges:
-                name = "{}.edge.{}-{}".format(self.volmesh.name, *edge)
-                color = self.edgecolor[edge]
-                attr = self.compile_attributes(name=name, color=color)
+        for edge in edges:
+            name = "{}.edge.{}-{}".format(meshname, *edge)
+            color = edgecolor[edge]
+            attr = self.compile_attributes(name=name, color=color)
 
-                line = Line(self.vertex_xyz[edge[0]], self.vertex_xyz[edge[1]])
+            line = Line(vertex_xyz[edge[0]], vertex_xyz[edge[1]])
 
-                guid = sc.doc.Objects.AddLine(line_to_rhino(line), attr)
-                guids.append(guid)
+            guid = add_line(line_to_rhino(line), attr)
+            guids.append(guid)
 
         if guids:
             if self.edgegroup:
@@ -258,20 +266,25 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
         """
         guids = []
 
-        faces = list(self.volmesh.faces()) if self.show_faces is True else self.show_faces or []
+        faces = self.volmesh.faces() if self.show_faces is True else self.show_faces or []
 
-        if faces:
-            for face in faces:
-                name = "{}.face.{}".format(self.volmesh.name, face)
-                color = self.facecolor[face]
-                attr = self.compile_attributes(name=name, color=color)
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        facecolor = self.facecolor
+        face_vertices = self.volmesh.face_vertices
+        add_mesh = sc.doc.Objects.AddMesh
 
-                vertices = [self.vertex_xyz[vertex] for vertex in self.volmesh.face_vertices(face)]
-                facet = ngon(len(vertices))
+        for face in faces:
+            name = "{}.face.{}".format(meshname, face)
+            color = facecolor[face]
+            attr = self.compile_attributes(name=name, color=color)
 
-                if facet:
-                    guid = sc.doc.Objects.AddMesh(vertices_and_faces_to_rhino(vertices, [facet]), attr)
-                    guids.append(guid)
+            vertices = [vertex_xyz[vertex] for vertex in face_vertices(face)]
+            facet = ngon(len(vertices))
+
+            if facet:
+                guid = add_mesh(vertices_and_faces_to_rhino(vertices, [facet]), attr)
+                guids.append(guid)
 
         if guids:
             if self.facegroup:
@@ -294,23 +307,28 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
         """
         guids = []
 
-        cells = list(self.volmesh.cells()) if self.show_cells is True else self.show_cells or []
+        cells = self.volmesh.cells() if self.show_cells is True else self.show_cells or []
 
-        if cells:
-            for cell in cells:
-                name = "{}.cell.{}".format(self.volmesh.name, cell)
-                color = self.cellcolor[cell]
-                attr = self.compile_attributes(name=name, color=color)
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        cellcolor = self.cellcolor
+        halfface_vertices = self.volmesh.halfface_vertices
+        add_mesh = sc.doc.Objects.AddMesh
 
-                vertices = self.volmesh.cell_vertices(cell)
-                faces = self.volmesh.cell_faces(cell)
-                vertex_index = dict((vertex, index) for index, vertex in enumerate(vertices))
+        for cell in cells:
+            name = "{}.cell.{}".format(meshname, cell)
+            color = cellcolor[cell]
+            attr = self.compile_attributes(name=name, color=color)
 
-                vertices = [self.vertex_xyz[vertex] for vertex in vertices]
-                faces = [[vertex_index[vertex] for vertex in self.volmesh.halfface_vertices(face)] for face in faces]
+            vertices = self.volmesh.cell_vertices(cell)
+            faces = self.volmesh.cell_faces(cell)
+            vertex_index = dict((vertex, index) for index, vertex in enumerate(vertices))
 
-                guid = sc.doc.Objects.AddMesh(vertices_and_faces_to_rhino(vertices, faces, disjoint=self.disjoint), attr)
-                guids.append(guid)
+            vertices = [vertex_xyz[vertex] for vertex in vertices]
+            faces = [[vertex_index[vertex] for vertex in halfface_vertices(face)] for face in faces]
+
+            guid = add_mesh(vertices_and_faces_to_rhino(vertices, faces, disjoint=self.disjoint), attr)
+            guids.append(guid)
 
         if guids:
             if self.cellgroup:
@@ -351,18 +369,23 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
 
         guids = []
 
-        for vertex in text:
-            name = "{}.vertex.{}.label".format(self.volmesh.name, vertex)  # type: ignore
-            color = self.vertexcolor[vertex]
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        vertexcolor = self.vertexcolor
+        add_textdot = sc.doc.Objects.AddTextDot
+
+        for vertex, label in text.items():
+            name = "{}.vertex.{}.label".format(meshname, vertex)  # type: ignore
+            color = vertexcolor[vertex]
             attr = self.compile_attributes(name=name, color=color)
 
-            point = self.vertex_xyz[vertex]
+            point = vertex_xyz[vertex]
 
-            dot = TextDot(str(text[vertex]), point)  # type: ignore
+            dot = TextDot(str(label), point)  # type: ignore
             dot.FontHeight = fontheight
             dot.FontFace = fontface
 
-            guid = sc.doc.Objects.AddTextDot(dot, attr)
+            guid = add_textdot(dot, attr)
             guids.append(guid)
 
         if group:
@@ -396,19 +419,24 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
 
         guids = []
 
-        for edge in text:
-            name = "{}.edge.{}-{}.label".format(self.volmesh.name, *edge)  # type: ignore
-            color = self.edgecolor[edge]
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        edgecolor = self.edgecolor
+        add_textdot = sc.doc.Objects.AddTextDot
+
+        for edge, label in text.items():
+            name = "{}.edge.{}-{}.label".format(meshname, *edge)  # type: ignore
+            color = edgecolor[edge]
             attr = self.compile_attributes(name="{}.label".format(name), color=color)
 
-            line = Line(self.vertex_xyz[edge[0]], self.vertex_xyz[edge[1]])
+            line = Line(vertex_xyz[edge[0]], vertex_xyz[edge[1]])
             point = point_to_rhino(line.midpoint)
 
-            dot = TextDot(str(text[edge]), point)  # type: ignore
+            dot = TextDot(str(label), point)  # type: ignore
             dot.FontHeight = fontheight
             dot.FontFace = fontface
 
-            guid = sc.doc.Objects.AddTextDot(dot, attr)
+            guid = add_textdot(dot, attr)
             guids.append(guid)
 
         if group:
@@ -442,19 +470,25 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
 
         guids = []
 
-        for face in text:
-            name = "{}.face.{}.label".format(self.volmesh.name, face)  # type: ignore
-            color = self.facecolor[face]
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        facecolor = self.facecolor
+        face_vertices = self.volmesh.face_vertices
+        add_textdot = sc.doc.Objects.AddTextDot
+
+        for face, label in text.items():
+            name = "{}.face.{}.label".format(meshname, face)  # type: ignore
+            color = facecolor[face]
             attr = self.compile_attributes(name="{}.label".format(name), color=color)
 
-            vertices = [self.vertex_xyz[vertex] for vertex in self.volmesh.face_vertices(face)]  # type: ignore
+            vertices = [vertex_xyz[vertex] for vertex in face_vertices(face)]  # type: ignore
             point = point_to_rhino(centroid_points(vertices))
 
-            dot = TextDot(str(text[face]), point)  # type: ignore
+            dot = TextDot(str(label), point)  # type: ignore
             dot.FontHeight = fontheight
             dot.FontFace = fontface
 
-            guid = sc.doc.Objects.AddTextDot(dot, attr)
+            guid = add_textdot(dot, attr)
             guids.append(guid)
 
         if group:
@@ -488,19 +522,25 @@ class RhinoVolMeshObject(RhinoSceneObject, VolMeshObject):
 
         guids = []
 
-        for cell in text:
-            name = "{}.cell.{}.label".format(self.volmesh.name, cell)  # type: ignore
-            color = self.cellcolor[cell]
+        meshname = self.volmesh.name
+        vertex_xyz = self.vertex_xyz
+        cellcolor = self.cellcolor
+        cell_vertices = self.volmesh.cell_vertices
+        add_textdot = sc.doc.Objects.AddTextDot
+
+        for cell, label in text.items():
+            name = "{}.cell.{}.label".format(meshname, cell)  # type: ignore
+            color = cellcolor[cell]
             attr = self.compile_attributes(name="{}.label".format(name), color=color)
 
-            vertices = [self.vertex_xyz[vertex] for vertex in self.volmesh.cell_vertices(cell)]  # type: ignore
+            vertices = [vertex_xyz[vertex] for vertex in cell_vertices(cell)]  # type: ignore
             point = point_to_rhino(centroid_points(vertices))
 
-            dot = TextDot(str(text[cell]), point)  # type: ignore
+            dot = TextDot(str(label), point)  # type: ignore
             dot.FontHeight = fontheight
             dot.FontFace = fontface
 
-            guid = sc.doc.Objects.AddTextDot(dot, attr)
+            guid = add_textdot(dot, attr)
             guids.append(guid)
 
         if group:
@@ -0,0 +1,52 @@
+import pytest
+
+from compas.colors import Color
+from compas.colors import ColorMap
+from compas.tolerance import TOL
+
+
+def test_colormap_interpolate_endpoints():
+    cmap = ColorMap.from_two_colors(Color.red(), Color.blue())
+
+    assert cmap.interpolate(0.0) == cmap(0.0)
+    assert cmap.interpolate(1.0) == cmap(1.0)
+
+
+def test_colormap_interpolate_blends():
+    cmap = ColorMap.from_two_colors(Color.red(), Color.blue())
+
+    # a value halfway between two entries blends them,
+    # whereas __call__ snaps to the lower entry
+    value = 0.5 / 255
+    c1 = cmap._rgb[0]
+    c2 = cmap._rgb[1]
+    color = cmap.interpolate(value)
+
+    assert TOL.is_close(color.r, 0.5 * (c1[0] + c2[0]))
+    assert TOL.is_close(color.g, 0.5 * (c1[1] + c2[1]))
+    assert TOL.is_close(color.b, 0.5 * (c1[2] + c2[2]))
+    assert cmap(value) == Color(*c1)
+
+
+def test_colormap_materialize():
+    cmap = ColorMap.from_two_colors(Color.red(), Color.blue())
+    colors = cmap.materialize(5)
+
+    assert len(colors) == 5
+    assert colors[0] == cmap(0.0)
+    assert colors[-1] == cmap(1.0)
+
+    with pytest.raises(ValueError):
+        cmap.materialize(1)
+
+
+def test_colormap_clamp():
+    cmap = ColorMap.from_two_colors(Color.red(), Color.blue())
+
+    with pytest.raises(KeyError):
+        cmap(-0.5)
+    with pytest.raises(KeyError):
+        cmap(1.5)
+
+    assert cmap(-0.5, clamp=True) == cmap(0.0)
+    assert cmap(1.5, clamp=True) == cmap(1.0)
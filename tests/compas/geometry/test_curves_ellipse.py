@@ -7,6 +7,9 @@ from compas.geometry import Frame
 from compas.geometry import Ellipse
 from compas.geometry import Plane
 
+WORLD_XY = Frame.worldXY()
+WORLD_ZX = Frame.worldZX()
+
 
 def test_ellipse_create():
     ellipse = Ellipse(major=1.0, minor=0.5)
@@ -21,7 +24,7 @@ def test_ellipse_create():
     assert ellipse.is_closed
     assert ellipse.is_periodic
 
-    assert ellipse.frame == Frame.worldXY()
+    assert ellipse.frame == WORLD_XY
 
     assert TOL.is_allclose(ellipse.point_at(0.0), [1.0, 0.0, 0.0])
     assert TOL.is_allclose(ellipse.point_at(0.25), [0.0, 0.5, 0.0])
@@ -49,7 +52,7 @@ def test_ellipse_create_with_frame():
     assert ellipse.is_closed
     assert ellipse.is_periodic
 
-    assert ellipse.frame == Frame.worldZX()
+    assert ellipse.frame == WORLD_ZX
 
     assert TOL.is_allclose(ellipse.point_at(0.0), [0.0, 0.0, 1.0])
     assert TOL.is_allclose(ellipse.point_at(0.25), [0.5, 0.0, 0.0])
@@ -124,9 +127,9 @@ def test_ellipse_create_from_point_major_minor():
     assert ellipse.is_periodic
 
     assert TOL.is_allclose(ellipse.frame.point, [1, 2, 3])
-    assert TOL.is_allclose(ellipse.frame.xaxis, Frame.worldXY().xaxis)
-    assert TOL.is_allclose(ellipse.frame.yaxis, Frame.worldXY().yaxis)
-    assert TOL.is_allclose(ellipse.frame.zaxis, Frame.worldXY().zaxis)
+    assert TOL.is_allclose(ellipse.frame.xaxis, WORLD_XY.xaxis)
+    assert TOL.is_allclose(ellipse.frame.yaxis, WORLD_XY.yaxis)
+    assert TOL.is_allclose(ellipse.frame.zaxis, WORLD_XY.zaxis)
 
 
 def test_ellipse_create_from_plane_major_minor():
@@ -81,6 +81,100 @@ def test_parabola_properties():
         parabola.focal
 
 
+def test_parabola_points_at():
+    parabola = Parabola(focal=1, frame=Frame.worldZX())
+    params = [-1.0, -0.5, 0.0, 0.5, 1.0]
+
+    for t, point in zip(params, parabola.points_at(params)):
+        assert TOL.is_allclose(point, parabola.point_at(t))
+
+    for t, point in zip(params, parabola.points_at(params, world=False)):
+        assert TOL.is_allclose(point, parabola.point_at(t, world=False))
+
+
+def test_parabola_tangent_and_normal_at():
+    parabola = Parabola(focal=1)
+
+    assert TOL.is_allclose(parabola.tangent_at(0.0), [1.0, 0.0, 0.0])
+    assert TOL.is_allclose(parabola.normal_at(0.0), [0.0, 1.0, 0.0])
+
+    for t in [-2.0, -0.5, 0.5, 2.0]:
+        tangent = parabola.tangent_at(t)
+        normal = parabola.normal_at(t)
+
+        assert TOL.is_close(tangent.length, 1.0)
+        assert TOL.is_close(normal.length, 1.0)
+        assert TOL.is_close(tangent.dot(normal), 0.0)
+
+        # the tangent follows the slope of y = a * x**2
+        assert TOL.is_close(tangent[1] / tangent[0], 2 * parabola.a * t)
+
+        # the normal points to the concave side for both signs of the parameter
+        assert normal[1] > 0
+
+
+def test_parabola_arc_length_at():
+    parabola = Parabola(focal=1)
+
+    assert TOL.is_close(parabola.arc_length_at(0.0), 0.0)
+    assert TOL.is_close(parabola.arc_length_at(-1.0), -parabola.arc_length_at(1.0))
+
+    n = 10000
+    length = 0.0
+    previous = parabola.point_at(0.0)
+    for i in range(1, n + 1):
+        point = parabola.point_at(i / n)
+        length += (point - previous).length
+        previous = point
+
+    assert abs(parabola.arc_length_at(1.0) - length) < 1e-6
+
+
+def test_parabola_point_at_arc_length():
+    parabola = Parabola(focal=1)
+    length = parabola.arc_length_at(1.0)
+
+    assert TOL.is_allclose(parabola.point_at_arc_length(0.0), parabola.point_at(0.0))
+    assert TOL.is_allclose(parabola.point_at_arc_length(length), parabola.point_at(1.0), atol=1e-4)
+
+    point = parabola.point_at_arc_length(0.5 * length)
+    assert abs(parabola.arc_length_at(point.x) - 0.5 * length) < 1e-4
+
+    with pytest.raises(ValueError):
+        parabola.point_at_arc_length(-0.1)
+    with pytest.raises(ValueError):
+        parabola.point_at_arc_length(length + 0.1)
+
+    # switching the parameter interval invalidates the cached table
+    total = parabola.arc_length_at(1.0) - parabola.arc_length_at(-1.0)
+    assert TOL.is_allclose(parabola.point_at_arc_length(0.0, domain=(-1.0, 1.0)), parabola.point_at(-1.0))
+    assert TOL.is_allclose(parabola.point_at_arc_length(total, domain=(-1.0, 1.0)), parabola.point_at(1.0), atol=1e-4)
+    assert TOL.is_allclose(parabola.point_at_arc_length(0.5 * total, domain=(-1.0, 1.0)), parabola.point_at(0.0), atol=1e-4)
+
+
+def test_parabola_point_at_arc_length_world():
+    parabola = Parabola(focal=1, frame=Frame.worldZX())
+    s = 0.5 * parabola.arc_length_at(1.0)
+
+    assert TOL.is_allclose(
+        parabola.point_at_arc_length(s),
+        parabola.point_at_arc_length(s, world=False).transformed(parabola.transformation),
+    )
+
+
+def test_parabola_frame_at():
+    parabola = Parabola(focal=1, frame=Frame.worldZX())
+
+    for t in [-1.0, 0.0, 0.5]:
+        frame = parabola.frame_at(t)
+        assert TOL.is_allclose(frame.point, parabola.point_at(t))
+        assert TOL.is_close(frame.xaxis.unitized().dot(parabola.tangent_at(t)), 1.0)
+        assert TOL.is_close(frame.yaxis.unitized().dot(parabola.normal_at(t)), 1.0)
+
+        local = parabola.frame_at(t, world=False)
+        assert TOL.is_allclose(local.point, parabola.point_at(t, world=False))
+
+
 # =============================================================================
 # Accessors
 # =============================================================================
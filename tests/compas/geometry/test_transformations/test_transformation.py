@@ -17,6 +17,23 @@ def test_transformation():
     ]
 
 
+def test_is_identity():
+    T = Transformation()
+    assert T.is_identity
+
+    S = Scale.from_factors([2, 2, 2])
+    assert not S.is_identity
+
+
+def test_is_rigid():
+    R = Rotation.from_axis_and_angle([0, 0, 1], 0.5)
+    T = Translation.from_vector([1, 2, 3])
+    assert (R * T).is_rigid
+
+    S = Scale.from_factors([2, 2, 2])
+    assert not S.is_rigid
+
+
 def test_copy():
     T = Transformation()
     assert T.matrix == T.copy().matrix